@@ -6,10 +6,18 @@ Handles creation, storage, and evaluation of CPU, memory, and disk usage alarms.
 """
 
 from typing import List, Dict, Optional
+import atexit
+import bisect
 import json
 import os
+import threading
 from logging_app import Logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class AlarmManager:
     """System resource alarm management service.
@@ -22,6 +30,10 @@ class AlarmManager:
         logger: Event logging service
     """
 
+    ALARMS_FILE = 'alarms.json'
+    SAVE_DELAY = 0.5
+    ALARM_TYPES = ('CPU', 'MEMORY', 'DISK')
+
     def __init__(self, logger: Logger) -> None:
         """Initialize alarm system.
         
@@ -30,7 +42,14 @@ class AlarmManager:
         """
         self.alarms = []
         self.logger = logger
+        self._dirty = False
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        self._by_type = {alarm_type: [] for alarm_type in self.ALARM_TYPES}
+        self._thresholds = {alarm_type: [] for alarm_type in self.ALARM_TYPES}
+        self._sorted_alarms = []
         self.load_alarms()
+        atexit.register(self.flush)
         
     def add_alarm(self, alarm_type: str, threshold: int) -> None:
         """Create and store new resource alarm.
@@ -39,46 +58,128 @@ class AlarmManager:
             alarm_type: Resource type to monitor
             threshold: Alert threshold percentage
         """
-        self.alarms.append({
+        alarm = {
             "type": alarm_type,
             "threshold": threshold,
             "active": True
-        })
+        }
+        self._prepare_alarm(alarm)
+        self.alarms.append(alarm)
+        bisect.insort(self._sorted_alarms, alarm, key=self._sort_key)
+        self._rebuild_index()
         self.logger.log_event("Alarm_Created", {"type": alarm_type, "threshold": threshold})
-        self.save_alarms()
+        self._schedule_save()
         
     def remove_alarm(self, index: int) -> None:
         """Remove alarm configuration.
         
         Args:
-            index: Position of alarm to remove
+            index: Position of alarm to remove, as ordered by get_alarms
         """
-        if 0 <= index < len(self.alarms):
-            self.alarms.pop(index)
+        if 0 <= index < len(self._sorted_alarms):
+            alarm = self._sorted_alarms.pop(index)
+            for i, stored in enumerate(self.alarms):
+                if stored is alarm:
+                    del self.alarms[i]
+                    break
+            self._rebuild_index()
             self.logger.log_event("Alarm_Removed")
-            self.save_alarms()
+            self._schedule_save()
     
     def load_alarms(self) -> None:
         """Load alarm configurations from storage."""
         try:
-            if os.path.exists('alarms.json'):
-                with open('alarms.json', 'r') as f:
-                    self.alarms = json.load(f)
+            if os.path.exists(self.ALARMS_FILE):
+                with open(self.ALARMS_FILE, 'rb') as f:
+                    data = f.read()
+                self.alarms = orjson.loads(data) if orjson else json.loads(data)
             else:
                 self.alarms = []
                 self.save_alarms()
         except Exception as e:
             self.alarms = []
             self.save_alarms()
+        for alarm in self.alarms:
+            self._prepare_alarm(alarm)
+        self._sorted_alarms = sorted(self.alarms, key=self._sort_key)
+        self._rebuild_index()
+    
+    @staticmethod
+    def _prepare_alarm(alarm: Dict) -> None:
+        """Attach derived runtime fields to an alarm.
+        
+        Fields prefixed with an underscore are never written to storage.
+        
+        Args:
+            alarm: Alarm configuration to extend in place
+        """
+        alarm['_type_upper'] = alarm['type'].upper()
+        alarm['_warn_tmpl'] = f"***WARNING! {alarm['type']} USAGE EXCEEDS {alarm['threshold']}%***"
+    
+    @staticmethod
+    def _sort_key(alarm: Dict) -> tuple:
+        """Ordering key for alarms: resource type, then threshold."""
+        return alarm['_type_upper'], alarm['threshold']
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild per-type alarm lists sorted by ascending threshold."""
+        by_type = {alarm_type: [] for alarm_type in self.ALARM_TYPES}
+        for alarm in self.alarms:
+            alarms = by_type.get(alarm['_type_upper'])
+            if alarms is not None and alarm.get('active', True):
+                alarms.append(alarm)
+        for alarms in by_type.values():
+            alarms.sort(key=lambda x: x['threshold'])
+        self._by_type = by_type
+        self._thresholds = {
+            alarm_type: [alarm['threshold'] for alarm in alarms]
+            for alarm_type, alarms in by_type.items()
+        }
     
     def save_alarms(self) -> None:
-        """Persist alarm configurations to storage."""
+        """Persist alarm configurations to storage.
+        
+        Writes to a temporary file first and swaps it into place, so a crash
+        mid-write never leaves a truncated alarms file behind.
+        """
+        tmp_path = self.ALARMS_FILE + '.tmp'
+        alarms = [
+            {key: value for key, value in alarm.items() if not key.startswith('_')}
+            for alarm in self.alarms
+        ]
         try:
-            with open('alarms.json', 'w') as f:
-                json.dump(self.alarms, f, indent=4)
+            if orjson:
+                data = orjson.dumps(alarms)
+            else:
+                data = json.dumps(alarms, separators=(',', ':')).encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.ALARMS_FILE)
         except Exception as e:
             pass
     
+    def flush(self) -> None:
+        """Write pending alarm changes to storage immediately."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.save_alarms()
+    
+    def _schedule_save(self) -> None:
+        """Mark alarms as modified and schedule a debounced save."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
     def check_alarms(self, cpu: Optional[float], memory: Optional[float], disk: Optional[float]) -> List[Dict]:
         """Evaluate resource metrics against alarm thresholds.
         
@@ -92,23 +193,27 @@ class AlarmManager:
         """
         triggered = []
         
-        for alarm in self.alarms:
-            alarm_type = alarm['type'].upper()
-            threshold = alarm['threshold']
-            
-            if alarm_type == 'CPU' and cpu and cpu >= threshold:
-                triggered.append(alarm)
-            elif alarm_type == 'MEMORY' and memory and memory >= threshold:
-                triggered.append(alarm)
-            elif alarm_type == 'DISK' and disk and disk >= threshold:
-                triggered.append(alarm)
+        for alarm_type, value in (('CPU', cpu), ('MEMORY', memory), ('DISK', disk)):
+            if value is not None:
+                # Thresholds are sorted, so every alarm up to the insertion
+                # point has a threshold at or below the current value
+                count = bisect.bisect_right(self._thresholds[alarm_type], value)
+                triggered.extend(self._by_type[alarm_type][:count])
         
         return triggered
     
+    def any_armed(self) -> bool:
+        """Check whether any active alarm is configured.
+        
+        Returns:
+            True if at least one resource has an armed alarm
+        """
+        return any(self._by_type.values())
+    
     def get_alarms(self) -> List[Dict]:
         """Retrieve sorted list of configured alarms.
         
         Returns:
-            List of alarms sorted by resource type
+            List of alarms sorted by resource type and threshold
         """
-        return sorted(self.alarms, key=lambda x: x['type'].upper())
\ No newline at end of file
+        return list(self._sorted_alarms)
\ No newline at end of file
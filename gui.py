@@ -6,7 +6,9 @@ The module uses curses to create an interactive terminal-based interface
 that enables system monitoring and alarm management.
 """
 
+import collections
 import curses
+import functools
 import time
 from datetime import datetime
 from monitoring import MonitoringSystem
@@ -15,6 +17,16 @@ from logging_app import Logger
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=256)
+def _bar(filled: int, length: int) -> str:
+    """Build the filled and empty segments of a progress bar."""
+    return "█" * filled + "░" * (length - filled)
+
+
+# Complete bars for the default 0-100 scale and length 20, indexed by whole percent
+_DEFAULT_BARS = tuple(f"[{_bar(percent * 20 // 100, 20)}]" for percent in range(101))
+
+
 class GUI:
     """
     Handles the graphical user interface in the terminal.
@@ -25,6 +37,12 @@ class GUI:
         logger: Instance of the logger
         current_selection: Current menu selection
         menu_items: List of menu options
+        _hw: Cached (height, width) of the terminal, reset on resize
+        _menu_layout: Cached (y, x, text) positions of the menu items
+        _menu_layout_size: Terminal (height, width) the menu layout was built for
+        _border_cache: Prerendered border pads keyed by size and title flag
+        _confirmation: Confirmation message currently shown over the menu
+        _dismiss_at: Monotonic deadline for hiding the confirmation message
     """
 
     def __init__(self, alarm_manager, monitoring_system, logger) -> None:
@@ -49,13 +67,51 @@ class GUI:
             "6. Start Alarm Monitoring",
             "0. Exit"
         ]
+        self._hw = None
+        self._menu_layout = None
+        self._menu_layout_size = None
+        self._border_cache = {}
+        self._confirmation = None
+        self._dismiss_at = None
         self.logger.log_event("Program_Started")
 
+    def _screen_size(self) -> tuple:
+        """
+        Returns the terminal size, querying curses only after a resize.
+
+        Returns:
+            tuple: Cached (height, width) of the main window
+        """
+        if self._hw is None:
+            self._hw = self.stdscr.getmaxyx()
+        return self._hw
+
+    def _handle_resize(self) -> None:
+        """
+        Drops all cached geometry after a KEY_RESIZE event.
+        """
+        self._hw = None
+        self._menu_layout = None
+        self._border_cache.clear()
+
+    def _getch(self) -> int:
+        """
+        Reads a key from the main window, dropping cached geometry on resize.
+        All key reads go through here so no view can swallow KEY_RESIZE.
+
+        Returns:
+            int: Key code, or -1 if no key arrived before a timeout
+        """
+        key = self.stdscr.getch()
+        if key == curses.KEY_RESIZE:
+            self._handle_resize()
+        return key
+
     def show_startup_message(self) -> None:
         """
         Displays startup message when the program initializes.
         """
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._screen_size()
         
         self.stdscr.clear()
         self.draw_border(self.stdscr, include_title=True)
@@ -80,16 +136,11 @@ class GUI:
         if value is None:
             value = 0
         
+        if total == 100 and length == 20 and 0 <= value <= 100:
+            return _DEFAULT_BARS[int(value)]
+        
         filled = int((float(value) / total) * length)
-        if value >= 90:
-            bar = "█" * filled + "░" * (length - filled)
-            return f"[{bar}]"
-        elif value >= 75:
-            bar = "█" * filled + "░" * (length - filled)
-            return f"[{bar}]"
-        else:
-            bar = "█" * filled + "░" * (length - filled)
-            return f"[{bar}]"
+        return f"[{_bar(filled, length)}]"
 
     def center_text(self, window, y: int, text: str) -> None:
         """
@@ -100,7 +151,7 @@ class GUI:
             y: Vertical position for the text
             text: Text to center and display
         """
-        height, width = window.getmaxyx()
+        height, width = self._screen_size() if window is self.stdscr else window.getmaxyx()
         x = (width - len(text)) // 2
         try:
             window.addstr(y, x, text)
@@ -132,12 +183,29 @@ class GUI:
         curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)   # Normal text
         curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)   # Selected object
         curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)     # Warnings
-        curses.init_pair(4, curses.COLOR_GREEN, curses.COLOR_BLACK)   # Confirmations
         curses.noecho()
         curses.cbreak()
         curses.curs_set(0)
         self.stdscr.keypad(True)
 
+    def _wait_for_key(self) -> int:
+        """
+        Blocks until a key is pressed, or until a pending confirmation
+        message is due to be hidden.
+
+        Returns:
+            int: Key code, or -1 if the confirmation deadline passed first
+        """
+        if self._dismiss_at is None:
+            return self._getch()
+
+        remaining = self._dismiss_at - time.monotonic()
+        self.stdscr.timeout(max(0, int(remaining * 1000)))
+        try:
+            return self._getch()
+        finally:
+            self.stdscr.timeout(-1)
+
     def cleanup_curses(self) -> None:
         """
         Resets terminal settings and exits curses.
@@ -151,18 +219,34 @@ class GUI:
 
     def show_confirmation(self, message: str, duration: float = 1) -> None:
         """
-        Displays a confirmation message for a given duration.
+        Displays a confirmation message over the menu for a given duration.
+        The menu stays responsive while the message is shown.
 
         Args:
             message: Message to display
             duration: Duration of the display in seconds
         """
-        height, width = self.stdscr.getmaxyx()
-        confirm_win = curses.newwin(3, width - 4, height // 2, 2)
-        confirm_win.clear()
-        confirm_win.addstr(1, (width - len(message) - 4) // 2, message)
-        confirm_win.refresh()
-        curses.napms(duration * 1000)
+        self._confirmation = message
+        self._dismiss_at = time.monotonic() + duration
+
+    def _draw_confirmation(self) -> None:
+        """
+        Stages the pending confirmation message until its deadline passes.
+        """
+        if self._dismiss_at is None:
+            return
+        if time.monotonic() >= self._dismiss_at:
+            self._confirmation = None
+            self._dismiss_at = None
+            return
+
+        height, width = self._screen_size()
+        try:
+            confirm_win = curses.newwin(3, width - 4, height // 2, 2)
+            confirm_win.addstr(1, (width - len(self._confirmation) - 4) // 2, self._confirmation)
+            confirm_win.noutrefresh()
+        except curses.error:
+            pass
 
     def draw_border(self, window, include_title: bool = False) -> None:
         """
@@ -172,57 +256,95 @@ class GUI:
             window: Curses window to draw the border in
             include_title: If True, include the HAL-9000 title in the border
         """
-        height, width = window.getmaxyx()
+        height, width = self._screen_size() if window is self.stdscr else window.getmaxyx()
+        key = (height, width, include_title)
+        
+        try:
+            pad = self._border_cache.get(key)
+            if pad is None:
+                pad = self._render_border(height, width, include_title)
+                self._border_cache[key] = pad
+            pad.overlay(window)
+        except curses.error:
+            pass
+
+    def _render_border(self, height: int, width: int, include_title: bool):
+        """
+        Renders a border of the given size into an offscreen pad.
+
+        Args:
+            height: Height of the border in rows
+            width: Width of the border in columns
+            include_title: If True, include the HAL-9000 title in the border
+
+        Returns:
+            Curses pad containing the rendered border
+        """
+        pad = curses.newpad(height, width)
         last_line_length = width - 1
         
         try:
-            window.addstr(0, 0, "─" * (last_line_length - 1))
-            window.addstr(height-1, 0, "─" * (last_line_length - 1))
+            pad.addstr(0, 0, "─" * (last_line_length - 1))
+            pad.addstr(height-1, 0, "─" * (last_line_length - 1))
             
             for y in range(1, height-1):
-                window.addstr(y, 0, "│")
-                window.addstr(y, last_line_length - 1, "│")
+                pad.addstr(y, 0, "│")
+                pad.addstr(y, last_line_length - 1, "│")
             
-            window.addstr(0, 0, "┌")
-            window.addstr(0, last_line_length - 1, "┐")
-            window.addstr(height-1, 0, "└")
-            window.addstr(height-1, last_line_length - 1, "┘")
+            pad.addstr(0, 0, "┌")
+            pad.addstr(0, last_line_length - 1, "┐")
+            pad.addstr(height-1, 0, "└")
+            pad.addstr(height-1, last_line_length - 1, "┘")
             
             if include_title:
                 title = "─ HAL-9000 ─"
                 title_pos = (width - len(title)) // 2
-                window.addstr(0, title_pos, title)
+                pad.addstr(0, title_pos, title)
                 
         except curses.error:
             pass
+        return pad
 
     def draw_menu(self) -> None:
         """
         Draws the main menu with all menu options.
         Highlights the selected option with green color.
         """
-        self.stdscr.clear()
+        self.stdscr.erase()
         self.draw_border(self.stdscr, include_title=True)
-        height, width = self.stdscr.getmaxyx()
         
-        menu_start_y = (height - len(self.menu_items)) // 2
+        if self._menu_layout is None or self._menu_layout_size != self._screen_size():
+            self._recompute_menu_layout()
         
-        for idx, item in enumerate(self.menu_items):
-            x = (width - len(item)) // 2
-            y = menu_start_y + idx
-            
+        for idx, (y, x, item) in enumerate(self._menu_layout):
             if idx == self.current_selection:
-                self.stdscr.attron(curses.color_pair(2))  # Green for selected
-                self.center_text(self.stdscr, y, item)
-                self.stdscr.attroff(curses.color_pair(2))
+                attr = curses.color_pair(2)  # Green for selected
             elif idx == 0 and self.monitoring_system.monitoring_active:
-                self.stdscr.attron(curses.color_pair(3))  # Red for active monitoring
-                self.center_text(self.stdscr, y, item)
-                self.stdscr.attroff(curses.color_pair(3))
+                attr = curses.color_pair(3)  # Red for active monitoring
             else:
-                self.center_text(self.stdscr, y, item)
+                attr = 0
             
-        self.stdscr.refresh()
+            try:
+                self.stdscr.addstr(y, x, item, attr)
+            except curses.error:
+                pass
+            
+        self.stdscr.noutrefresh()
+        self._draw_confirmation()
+        curses.doupdate()
+
+    def _recompute_menu_layout(self) -> None:
+        """
+        Calculates centered screen positions for all menu items.
+        Only needs to run again when the terminal size changes.
+        """
+        height, width = self._screen_size()
+        self._menu_layout_size = (height, width)
+        menu_start_y = (height - len(self.menu_items)) // 2
+        self._menu_layout = [
+            (menu_start_y + idx, (width - len(item)) // 2, item)
+            for idx, item in enumerate(self.menu_items)
+        ]
 
     def show_monitoring_data(self) -> None:
         """
@@ -230,28 +352,33 @@ class GUI:
         Updates continuously until the user presses 'q'.
         """
         if not self.monitoring_system.monitoring_active:
-            height, width = self.stdscr.getmaxyx()
+            height, width = self._screen_size()
             self.stdscr.clear()
             self.draw_border(self.stdscr, include_title=True)
             self.center_text(self.stdscr, height//2-2, "No active monitoring")
             self.center_text(self.stdscr, height//2, "Press any key to return")
             self.stdscr.refresh()
-            self.stdscr.getch()
+            self._getch()
             return
 
-        self.stdscr.nodelay(1)
+        self.stdscr.timeout(100)
+        frame_size = None
         
         try:
             while True:
-                self.stdscr.clear()
-                self.draw_border(self.stdscr, include_title=True)
-                height, width = self.stdscr.getmaxyx()
-                
                 cpu, memory, disk = self.monitoring_system.get_live_data()
                 
                 if cpu is None or memory is None or disk is None:
                     break
                 
+                # Static parts are only redrawn when the terminal size changes
+                height, width = self._screen_size()
+                if frame_size != (height, width):
+                    self.stdscr.clear()
+                    self.draw_border(self.stdscr, include_title=True)
+                    self.center_text(self.stdscr, height-3, "Press 'q' to return to menu")
+                    frame_size = (height, width)
+                
                 start_y = height // 2 - 2
                 
                 cpu_bar = self.create_progress_bar(cpu)
@@ -262,96 +389,105 @@ class GUI:
                 mem_text = f"Memory Usage | {memory:5.1f}% {mem_bar}"
                 disk_text = f"Disk Usage   | {disk:5.1f}% {disk_bar}"
                 
+                # Lines have a fixed width, so overwriting them in place
+                # replaces the previous values without clearing the row
                 self.center_text(self.stdscr, start_y, cpu_text)
                 self.center_text(self.stdscr, start_y + 2, mem_text)
                 self.center_text(self.stdscr, start_y + 4, disk_text)
                 
-                self.center_text(self.stdscr, height-3, "Press 'q' to return to menu")
+                self.stdscr.noutrefresh()
+                curses.doupdate()
                 
-                self.stdscr.refresh()
-                
-                try:
-                    key = self.stdscr.getch()
-                    if key == ord('q'):
-                        break
-                except curses.error:
-                    pass
-                
-                curses.napms(100)
+                key = self._getch()
+                if key == ord('q'):
+                    break
                 
         finally:
-            self.stdscr.nodelay(0)
+            self.stdscr.timeout(-1)
 
     def show_monitoring_interface(self) -> None:
         """
         Shows the alarm monitoring interface with real-time alerts.
         """
         if not self.monitoring_system.monitoring_active:
-            height, width = self.stdscr.getmaxyx()
+            height, width = self._screen_size()
             self.stdscr.clear()
             self.draw_border(self.stdscr, include_title=True)
             self.center_text(self.stdscr, height//2-2, "No active monitoring")
             self.center_text(self.stdscr, height//2, "Press 'q' to return")
             self.stdscr.refresh()
-            self.stdscr.getch()
+            self._getch()
             return
 
-        height, width = self.stdscr.getmaxyx()
-        warning_history = []
-        last_check = time.time()
+        warning_history = collections.deque(maxlen=8)  # Keep last 8 warnings
+        seen_warnings = set()
         check_interval = 5
+        next_check = time.monotonic() + check_interval
         
-        self.stdscr.nodelay(1)
+        self.stdscr.timeout(100)
+        frame_size = None
+        shown_warnings = None
         
         try:
             while True:
-                current_time = time.time()
-                if current_time - last_check >= check_interval:
+                current_time = time.monotonic()
+                if current_time >= next_check and self.alarm_manager.any_armed():
                     cpu, memory, disk = self.monitoring_system.get_alarm_data()
                     triggered_alarms = self.alarm_manager.check_alarms(cpu, memory, disk)
                     
                     if triggered_alarms:
                         timestamp = datetime.now().strftime("[%H:%M:%S]")
                         for alarm in triggered_alarms:
-                            warning = f"{timestamp} ***WARNING! {alarm['type']} USAGE EXCEEDS {alarm['threshold']}%***"
-                            if warning not in warning_history:
-                                warning_history.insert(0, warning)
-                        warning_history = warning_history[:8]  # Keep last 8 warnings
-                    last_check = current_time
-
-                self.stdscr.clear()
-                self.draw_border(self.stdscr, include_title=True)
-                
-                # Show monitoring status
-                self.stdscr.attron(curses.color_pair(1))
-                self.center_text(self.stdscr, 3, "MONITORING ACTIVE")
-                self.stdscr.attroff(curses.color_pair(1))
+                            warning = f"{timestamp} {alarm['_warn_tmpl']}"
+                            if warning not in seen_warnings:
+                                if len(warning_history) == warning_history.maxlen:
+                                    seen_warnings.discard(warning_history[-1])
+                                warning_history.appendleft(warning)
+                                seen_warnings.add(warning)
+                    next_check = current_time + check_interval
+
+                # Static parts are only redrawn when the terminal size changes
+                height, width = self._screen_size()
+                if frame_size != (height, width):
+                    self.stdscr.clear()
+                    self.draw_border(self.stdscr, include_title=True)
+                    
+                    # Show monitoring status
+                    self.stdscr.attron(curses.color_pair(1))
+                    self.center_text(self.stdscr, 3, "MONITORING ACTIVE")
+                    self.stdscr.attroff(curses.color_pair(1))
+                    
+                    self.center_text(self.stdscr, height-3, "Press 'q' to return to menu")
+                    frame_size = (height, width)
+                    shown_warnings = None
                 
-                # Show warnings
-                warning_y = 5
-                if warning_history:
-                    for warning in warning_history:
+                # Warning rows are only rewritten when a new warning arrives
+                warnings = tuple(warning_history)
+                if warnings != shown_warnings:
+                    blank = " " * (width - 3)
+                    for warning_y, warning in enumerate(warnings, start=5):
+                        try:
+                            # Blank the row inside the border before writing the
+                            # new text, since warnings differ in length
+                            self.stdscr.addstr(warning_y, 1, blank)
+                        except curses.error:
+                            pass
                         self.stdscr.attron(curses.color_pair(1))
                         self.center_text(self.stdscr, warning_y, warning)
                         self.stdscr.attroff(curses.color_pair(1))
-                        warning_y += 1
+                    shown_warnings = warnings
 
-                self.center_text(self.stdscr, height-3, "Press 'q' to return to menu")
-                self.stdscr.refresh()
+                self.stdscr.noutrefresh()
+                curses.doupdate()
 
-                try:
-                    key = self.stdscr.getch()
-                    if key == ord('q'):
-                        break
-                except curses.error:
-                    pass
-                
-                time.sleep(0.1)
+                key = self._getch()
+                if key == ord('q'):
+                    break
                 
         except KeyboardInterrupt:
             pass
         finally:
-            self.stdscr.nodelay(0)
+            self.stdscr.timeout(-1)
 
     def show_create_alarm_menu(self) -> None:
         """
@@ -362,7 +498,7 @@ class GUI:
         
         while True:
             self.stdscr.clear()
-            height, width = self.stdscr.getmaxyx()
+            height, width = self._screen_size()
             self.draw_border(self.stdscr, include_title=True)
             
             # Draw menu items
@@ -379,7 +515,7 @@ class GUI:
             self.stdscr.refresh()
             
             # Handle key input
-            key = self.stdscr.getch()
+            key = self._getch()
             if key == curses.KEY_UP and current_selection > 0:
                 current_selection -= 1
             elif key == curses.KEY_DOWN and current_selection < len(alarm_types) - 1:
@@ -395,7 +531,7 @@ class GUI:
         """
         Create a new alarm with the specified type and threshold.
         """
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._screen_size()
         self.stdscr.clear()
         self.draw_border(self.stdscr, include_title=True)
         
@@ -407,6 +543,9 @@ class GUI:
         curses.echo()
         threshold_str = self.stdscr.getstr(height//2, width//2-2, 3).decode('utf-8')
         curses.noecho()
+        # getstr() consumes KEY_RESIZE itself, so compare against the real size
+        if self.stdscr.getmaxyx() != self._hw:
+            self._handle_resize()
         
         try:
             threshold = int(threshold_str)
@@ -425,20 +564,20 @@ class GUI:
         """
         Display all configured alarms in a sorted list.
         """
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._screen_size()
         self.stdscr.clear()
         self.draw_border(self.stdscr, include_title=True)
 
-        if not self.alarm_manager.alarms:
+        # Larmen hålls redan sorterade efter typ och tröskelvärde
+        sorted_alarms = self.alarm_manager.get_alarms()
+
+        if not sorted_alarms:
             self.center_text(self.stdscr, height//2, "No alarms configured")
             self.center_text(self.stdscr, height//2 + 2, "Press any key to return to menu")
             self.stdscr.refresh()
-            self.stdscr.getch()
+            self._getch()
             return
 
-        # Sortera larmen efter typ och tröskelvärde
-        sorted_alarms = sorted(self.alarm_manager.alarms, key=lambda x: (x['type'], x['threshold']))
-        
         # Visa rubrik
         self.center_text(self.stdscr, 2, "Configured alarms:")
         
@@ -449,7 +588,7 @@ class GUI:
 
         self.center_text(self.stdscr, height-3, "Press any key to return to menu")
         self.stdscr.refresh()
-        self.stdscr.getch()
+        self._getch()
 
     def remove_alarm(self) -> None:
         """
@@ -457,18 +596,18 @@ class GUI:
         """
         alarms = self.alarm_manager.get_alarms()
         if not alarms:
-            height, width = self.stdscr.getmaxyx()
+            height, width = self._screen_size()
             self.stdscr.clear()
             self.draw_border(self.stdscr, include_title=True)
             self.center_text(self.stdscr, height//2-2, "No alarms configured")
             self.center_text(self.stdscr, height//2, "Press any key to return")
             self.stdscr.refresh()
-            self.stdscr.getch()
+            self._getch()
             return
 
         current_selection = 0
         while True:
-            height, width = self.stdscr.getmaxyx()
+            height, width = self._screen_size()
             self.stdscr.clear()
             self.draw_border(self.stdscr, include_title=True)
             
@@ -489,7 +628,7 @@ class GUI:
             self.stdscr.refresh()
 
             # Handle input
-            key = self.stdscr.getch()
+            key = self._getch()
             if key == curses.KEY_UP and current_selection > 0:
                 current_selection -= 1
             elif key == curses.KEY_DOWN and current_selection < len(alarms) - 1:
@@ -504,7 +643,7 @@ class GUI:
                 
                 # Remove alarm and wait for key press
                 self.alarm_manager.remove_alarm(current_selection)
-                self.stdscr.getch()
+                self._getch()
                 return
             elif key == ord('q'):
                 return
@@ -521,7 +660,7 @@ class GUI:
             while True:
                 try:
                     self.draw_menu()
-                    key = self.stdscr.getch()
+                    key = self._wait_for_key()
                     
                     if key in [curses.KEY_UP, ord('k')] and self.current_selection > 0:
                         self.current_selection -= 1
@@ -6,7 +6,9 @@ Records system events, state changes, and monitoring activities to timestamped l
 """
 
 from datetime import datetime
+import atexit
 import os
+import time
 
 
 class Logger:
@@ -20,6 +22,12 @@ class Logger:
         log_file: File path for event logs
         allowed_events: Valid event types for logging
     """
+
+    # Events with a custom log line; everything else is logged by name
+    _FORMATTERS = {
+        "Alarm_Created": lambda ts, d: f"{ts}_Alarm_Created_{d['type']}_{d['threshold']}_Percent",
+        "Alarm_Triggered": lambda ts, d: f"{ts}_Alarm_Triggered_{d['type']}_{d['threshold']}_Percent",
+    }
     
     allowed_events = {
         "Program_Started",
@@ -39,8 +47,13 @@ class Logger:
     def __init__(self) -> None:
         """Initialize logging service with timestamped file."""
         os.makedirs("logs", exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
         self.log_file = f"logs/log_{timestamp}.log"
+        # Line buffered so every event reaches the file even if the program crashes
+        self._fh = open(self.log_file, 'a', buffering=1, encoding='utf-8')
+        atexit.register(self._fh.close)
+        self._ts_cache = ""
+        self._ts_minute = -1
 
     def log_event(self, event_type: str, data: dict = None) -> None:
         """Record a system event with timestamp.
@@ -49,35 +62,18 @@ class Logger:
             event_type: Type of event to log
             data: Optional additional event data
         """
-        timestamp = datetime.now().strftime("%d/%m/%Y_%H:%M")
+        now = time.time()
+        minute = int(now // 60)
+        if minute != self._ts_minute:
+            # Timestamps only have minute resolution, so reformat once a minute
+            self._ts_cache = datetime.fromtimestamp(now).strftime("%d/%m/%Y_%H:%M")
+            self._ts_minute = minute
+        timestamp = self._ts_cache
         
-        match event_type:
-            case "Program_Started":
-                log_entry = f"{timestamp}_Program_Started"
-            case "Program_Ended":
-                log_entry = f"{timestamp}_Program_Ended"
-            case "Program_Ended_By_User":
-                log_entry = f"{timestamp}_Program_Ended_By_User"
-            case "Monitoring_Started":
-                log_entry = f"{timestamp}_Monitoring_Started"
-            case "Monitoring_Stopped":
-                log_entry = f"{timestamp}_Monitoring_Stopped"
-            case "Displaying_Active_Monitoring":
-                log_entry = f"{timestamp}_Displaying_Active_Monitoring"
-            case "Displaying_Alarms":
-                log_entry = f"{timestamp}_Displaying_Alarms"
-            case "Monitoring_Interface_Started":
-                log_entry = f"{timestamp}_Monitoring_Interface_Started"
-            case "System_Values_Retrieved":
-                log_entry = f"{timestamp}_System_Values_Retrieved"
-            case "Alarm_Created" if data:
-                log_entry = f"{timestamp}_Alarm_Created_{data['type']}_{data['threshold']}_Percent"
-            case "Alarm_Removed" if data:
-                log_entry = f"{timestamp}_Alarm_Removed"
-            case "Alarm_Triggered" if data:
-                log_entry = f"{timestamp}_Alarm_Triggered_{data['type']}_{data['threshold']}_Percent"
-            case _:
-                log_entry = f"{timestamp}_{event_type}"
-        
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry + '\n')
\ No newline at end of file
+        fmt = self._FORMATTERS.get(event_type)
+        log_entry = fmt(timestamp, data) if fmt and data else f"{timestamp}_{event_type}"
+        self._fh.write(log_entry + '\n')
+
+    def close(self) -> None:
+        """Close the log file."""
+        self._fh.close()
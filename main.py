@@ -51,6 +51,7 @@ def main() -> None:
         gui.run()
     finally:
         logger.log_event("Program_Ended")
+        logger.close()
 
 
 if __name__ == "__main__":
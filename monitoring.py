@@ -6,8 +6,35 @@ Provides tracking of CPU, memory, and disk usage with historical data retention.
 """
 
 import psutil
-from typing import Optional, Tuple, List, Dict
-from threading import Thread
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, Tuple, Dict
+from threading import Event, Thread
+
+
+@dataclass(frozen=True)
+class _Sample:
+    """Single reading of all monitored system resources."""
+
+    cpu: float
+    mem_pct: float
+    disk_pct: float
+    mem_used: int
+    mem_total: int
+    disk_used: int
+    disk_total: int
+    ts: float
+
+
+def _return_none() -> None:
+    """Getter used for single values while monitoring is inactive."""
+    return None
+
+
+def _return_no_data() -> Tuple[None, None, None]:
+    """Getter used for value triples while monitoring is inactive."""
+    return None, None, None
 
 
 class MonitoringSystem:
@@ -15,9 +42,12 @@ class MonitoringSystem:
     
     Tracks and stores system resource usage including CPU, memory, and disk utilization.
     Supports real-time monitoring, historical data collection, and alarm triggers.
+    A background thread samples all resources once per interval, and the
+    public getters return the most recent sample without touching psutil.
     
     Attributes:
         logger: Logging service for system events
+        sample_interval: Seconds between resource samples
         monitoring_active: Status of monitoring service
         monitoring_thread: Background monitoring process
         cpu_usage: CPU utilization history
@@ -26,29 +56,78 @@ class MonitoringSystem:
     """
 
     MAX_HISTORY = 1000
+    # Getters replaced by no-op versions on the instance while monitoring is
+    # inactive, so the active versions never need to check the state
+    _SINGLE_GETTERS = (
+        'get_cpu_usage',
+        'get_memory_usage',
+        'get_disk_usage',
+        'get_memory_details',
+        'get_disk_details',
+    )
+    _TRIPLE_GETTERS = ('get_alarm_data', 'get_live_data')
 
-    def __init__(self, logger=None) -> None:
+    def __init__(self, logger=None, sample_interval: float = 1.0) -> None:
         """Initialize the monitoring system.
 
         Args:
             logger: Event logging service instance
+            sample_interval: Seconds between resource samples
         """
         self.logger = logger
+        self.sample_interval = sample_interval
         self.monitoring_active = False
         self.monitoring_thread = None
-        self.cpu_usage: List[float] = []
-        self.memory_usage: List[float] = []
-        self.disk_usage: List[float] = []
+        self.cpu_usage: Deque[float] = deque(maxlen=self.MAX_HISTORY)
+        self.memory_usage: Deque[float] = deque(maxlen=self.MAX_HISTORY)
+        self.disk_usage: Deque[float] = deque(maxlen=self.MAX_HISTORY)
+        self._sample: Optional[_Sample] = None
+        self._sample_ready = Event()
+        self._stop_event = Event()
+        self._bind_getters(active=False)
+
+    def _bind_getters(self, active: bool) -> None:
+        """Switch the public getters between live and inactive versions.
+
+        Args:
+            active: True to expose the sample-backed getters
+        """
+        if active:
+            for name in self._SINGLE_GETTERS + self._TRIPLE_GETTERS:
+                self.__dict__.pop(name, None)
+            return
+        
+        for name in self._SINGLE_GETTERS:
+            setattr(self, name, _return_none)
+        self.get_live_data = _return_no_data
+        self.get_alarm_data = self._alarm_data_inactive
+
+    def _alarm_data_inactive(self) -> Tuple[None, None, None]:
+        """Report an alarm data request made while monitoring is inactive."""
+        self.logger.log_event("Monitoring_Data_Request_Failed", {"reason": "Monitoring not active"})
+        return None, None, None
 
     def start_monitoring(self) -> None:
         """Start system resource monitoring."""
         self.monitoring_active = True
+        self._bind_getters(active=True)
+        if self.monitoring_thread is None or not self.monitoring_thread.is_alive():
+            self._sample = None
+            self._sample_ready.clear()
+            self._stop_event.clear()
+            self.monitoring_thread = Thread(target=self._sampler_loop, daemon=True)
+            self.monitoring_thread.start()
         if self.logger:
             self.logger.log_event("Monitoring_Started")
 
     def stop_monitoring(self) -> None:
         """Stop system resource monitoring."""
         self.monitoring_active = False
+        self._bind_getters(active=False)
+        self._stop_event.set()
+        if self.monitoring_thread is not None:
+            self.monitoring_thread.join()
+            self.monitoring_thread = None
         if self.logger:
             self.logger.log_event("Monitoring_Stopped")
 
@@ -56,20 +135,67 @@ class MonitoringSystem:
         """Perform clean system shutdown."""
         self.stop_monitoring()
 
+    def _sampler_loop(self) -> None:
+        """Sample system resources until monitoring is stopped."""
+        # The first non-blocking call only sets the reference point for
+        # later CPU measurements and always returns 0.0
+        psutil.cpu_percent(interval=None)
+        
+        # wait() returns True as soon as stop_monitoring() sets the event
+        while not self._stop_event.wait(self.sample_interval):
+            try:
+                sample = self._read_sample()
+            except Exception as e:
+                if self.logger:
+                    self.logger.log_event("Monitoring_Error", {"error": str(e)})
+                continue
+            
+            self.cpu_usage.append(sample.cpu)
+            self.memory_usage.append(sample.mem_pct)
+            self.disk_usage.append(sample.disk_pct)
+            
+            self._sample = sample
+            self._sample_ready.set()
+
+    def _read_sample(self) -> _Sample:
+        """Read all monitored resources from psutil once.
+
+        Returns:
+            Fresh resource sample
+        """
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        return _Sample(
+            cpu=psutil.cpu_percent(interval=None),
+            mem_pct=memory.percent,
+            disk_pct=disk.percent,
+            mem_used=memory.used,
+            mem_total=memory.total,
+            disk_used=disk.used,
+            disk_total=disk.total,
+            ts=time.monotonic(),
+        )
+
+    def _current_sample(self) -> Optional[_Sample]:
+        """Get the latest resource sample.
+
+        Waits for the first sample after monitoring has been started.
+
+        Returns:
+            Latest sample or None if none is available
+        """
+        if not self._sample_ready.is_set():
+            self._sample_ready.wait(self.sample_interval * 2)
+        return self._sample
+
     def get_cpu_usage(self) -> Optional[float]:
         """Get current CPU utilization percentage.
 
         Returns:
             Current CPU usage or None if monitoring inactive
         """
-        if not self.monitoring_active:
-            return None
-        
-        usage = psutil.cpu_percent(interval=1)
-        self.cpu_usage.append(usage)
-        if len(self.cpu_usage) > self.MAX_HISTORY:
-            self.cpu_usage = self.cpu_usage[-self.MAX_HISTORY:]
-        return usage
+        sample = self._current_sample()
+        return sample.cpu if sample else None
 
     def get_memory_usage(self) -> Optional[float]:
         """Get current memory utilization percentage.
@@ -77,14 +203,8 @@ class MonitoringSystem:
         Returns:
             Current memory usage or None if monitoring inactive
         """
-        if not self.monitoring_active:
-            return None
-        
-        usage = psutil.virtual_memory().percent
-        self.memory_usage.append(usage)
-        if len(self.memory_usage) > self.MAX_HISTORY:
-            self.memory_usage = self.memory_usage[-self.MAX_HISTORY:]
-        return usage
+        sample = self._current_sample()
+        return sample.mem_pct if sample else None
 
     def get_disk_usage(self) -> Optional[float]:
         """Get current disk utilization percentage.
@@ -92,14 +212,8 @@ class MonitoringSystem:
         Returns:
             Current disk usage or None if monitoring inactive
         """
-        if not self.monitoring_active:
-            return None
-        
-        usage = psutil.disk_usage('/').percent
-        self.disk_usage.append(usage)
-        if len(self.disk_usage) > self.MAX_HISTORY:
-            self.disk_usage = self.disk_usage[-self.MAX_HISTORY:]
-        return usage
+        sample = self._current_sample()
+        return sample.disk_pct if sample else None
 
     def get_memory_details(self) -> Optional[Tuple[float, float, float]]:
         """Get detailed memory statistics.
@@ -107,13 +221,12 @@ class MonitoringSystem:
         Returns:
             Tuple of (used_gb, total_gb, usage_percentage) or None if inactive
         """
-        if not self.monitoring_active:
+        sample = self._current_sample()
+        if sample is None:
             return None
-        
-        memory = psutil.virtual_memory()
-        used_gb = memory.used / (1024 ** 3)
-        total_gb = memory.total / (1024 ** 3)
-        return used_gb, total_gb, memory.percent
+        used_gb = sample.mem_used / (1024 ** 3)
+        total_gb = sample.mem_total / (1024 ** 3)
+        return used_gb, total_gb, sample.mem_pct
 
     def get_disk_details(self) -> Optional[Tuple[float, float, float]]:
         """Get detailed disk statistics.
@@ -121,13 +234,12 @@ class MonitoringSystem:
         Returns:
             Tuple of (used_gb, total_gb, usage_percentage) or None if inactive
         """
-        if not self.monitoring_active:
+        sample = self._current_sample()
+        if sample is None:
             return None
-        
-        disk = psutil.disk_usage('/')
-        used_gb = disk.used / (1024 ** 3)
-        total_gb = disk.total / (1024 ** 3)
-        return used_gb, total_gb, disk.percent
+        used_gb = sample.disk_used / (1024 ** 3)
+        total_gb = sample.disk_total / (1024 ** 3)
+        return used_gb, total_gb, sample.disk_pct
 
     def get_alarm_data(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
         """Retrieve current system metrics for alarm evaluation.
@@ -135,54 +247,27 @@ class MonitoringSystem:
         Returns:
             Tuple of (cpu_usage, memory_usage, disk_usage) percentages
         """
-        if not self.monitoring_active:
-            self.logger.log_event("Monitoring_Data_Request_Failed", {"reason": "Monitoring not active"})
+        sample = self._current_sample()
+        if sample is None:
+            self.logger.log_event("System_Values_Error", {"error": "No sample available"})
             return None, None, None
         
-        try:
-            cpu = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory().percent
-            disk = psutil.disk_usage('/').percent
-            
-            self.logger.log_event("System_Values_Retrieved", {
-                "cpu": cpu,
-                "memory": memory,
-                "disk": disk
-            })
-            
-            return cpu, memory, disk
-        except Exception as e:
-            self.logger.log_event("System_Values_Error", {"error": str(e)})
-            return None, None, None
+        self.logger.log_event("System_Values_Retrieved", {
+            "cpu": sample.cpu,
+            "memory": sample.mem_pct,
+            "disk": sample.disk_pct
+        })
+        
+        return sample.cpu, sample.mem_pct, sample.disk_pct
 
     def get_live_data(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
         """Retrieve current system resource utilization stats.
 
         Returns:
             Tuple of (cpu_usage, memory_usage, disk_usage) percentages
-            Returns None values if monitoring inactive or on error
+            Returns None values if monitoring inactive or no sample is available
         """
-        if not self.monitoring_active:
+        sample = self._current_sample()
+        if sample is None:
             return None, None, None
-        
-        try:
-            cpu = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory().percent
-            disk = psutil.disk_usage('/').percent
-            
-            self.cpu_usage.append(cpu)
-            self.memory_usage.append(memory)
-            self.disk_usage.append(disk)
-            
-            if len(self.cpu_usage) > self.MAX_HISTORY:
-                self.cpu_usage = self.cpu_usage[-self.MAX_HISTORY:]
-            if len(self.memory_usage) > self.MAX_HISTORY:
-                self.memory_usage = self.memory_usage[-self.MAX_HISTORY:]
-            if len(self.disk_usage) > self.MAX_HISTORY:
-                self.disk_usage = self.disk_usage[-self.MAX_HISTORY:]
-                
-            return cpu, memory, disk
-        except Exception as e:
-            if self.logger:
-                self.logger.log_event("Monitoring_Error", {"error": str(e)})
-            return None, None, None
\ No newline at end of file
+        return sample.cpu, sample.mem_pct, sample.disk_pct